@@ -3,10 +3,118 @@
 Debug version of the LinkedIn scraper to help troubleshoot issues
 """
 
+import os
+import re
 import requests
-from bs4 import BeautifulSoup
 import sys
 
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # selectolax's Lexbor parser is much faster and lighter than building a
+    # full BeautifulSoup tree for the handful of lookups we do here.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    import lxml.html as lxml_html
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Built once per process; only these tags are inspected through the
+    # soup (h2/section queries go through lxml XPath instead), so the
+    # fallback parse skips tree nodes for everything else.
+    _STRAINER = SoupStrainer(['title', 'meta', 'h1'])
+
+try:
+    # httpx speaks HTTP/2, which LinkedIn supports: requests are
+    # multiplexed over one connection with HPACK header compression.
+    import httpx
+except ImportError:
+    httpx = None
+
+from linkedin_scraper import canonicalize_profile_url
+
+# Browser-like request headers, built once at import instead of per
+# call; the MappingProxyType view keeps the shared constant read-only.
+HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+
+# Shared session so repeated debug runs in one process reuse the same
+# keep-alive connection pool instead of paying a TLS handshake per call.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+# Preferred transport when httpx is installed; SESSION stays as the
+# HTTP/1.1 fallback.
+CLIENT = None
+_FETCH_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    try:
+        CLIENT = httpx.Client(
+            http2=True,
+            timeout=30,
+            follow_redirects=True,
+            headers=dict(HEADERS),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+        _FETCH_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+    except ImportError:
+        # http2=True needs the 'h2' package (httpx[http2]); a plain httpx
+        # install - e.g. the one gradio drags in - raises ImportError here,
+        # so fall back to the requests session.
+        pass
+
+
+def _fetch(url):
+    """Fetch a URL, streaming the body into a single bytes buffer.
+
+    Returns (status_code, final_url, content_type, content).
+    """
+    buf = bytearray()
+    if CLIENT is not None:
+        with CLIENT.stream('GET', url) as response:
+            for chunk in response.iter_bytes(65536):
+                buf.extend(chunk)
+            return (response.status_code, str(response.url),
+                    response.headers.get('content-type', 'Unknown'), bytes(buf))
+
+    response = SESSION.get(url, timeout=30, stream=True)
+    for chunk in response.iter_content(65536):
+        buf.extend(chunk)
+    return (response.status_code, response.url,
+            response.headers.get('content-type', 'Unknown'), bytes(buf))
+
+
+# Blocking indicators are matched in a single case-insensitive pass over
+# the raw bytes, instead of lowercasing the whole page (an O(n) copy)
+# and scanning it once per indicator.
+_BLOCKING_PATTERN = re.compile(rb'authwall|login|sign in|join now|captcha|robot', re.IGNORECASE)
+_BLOCKING_MESSAGES = {
+    b'authwall': 'Authentication wall detected',
+    b'login': 'Login page detected',
+    b'sign in': 'Sign in prompt detected',
+    b'join now': 'Join prompt detected',
+    b'captcha': 'CAPTCHA detected',
+    b'robot': 'Bot detection triggered',
+}
+
 
 def debug_scrape(url):
     """Debug function to see what's being returned"""
@@ -16,119 +124,138 @@ def debug_scrape(url):
     print("="*60)
     print(f"\n📍 Target URL: {url}\n")
 
-    # Check URL format
-    if not url.startswith('https://www.linkedin.com/in/'):
+    # Check URL format and canonicalize (lowercased slug, no trailing
+    # slash or tracking parameters)
+    url = canonicalize_profile_url(url)
+    if url is None:
         print("❌ ERROR: Invalid URL format")
         print("   URL must start with: https://www.linkedin.com/in/")
         return
 
     print("✅ URL format is valid\n")
 
-    # Set up headers
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-
     print("📡 Making request to LinkedIn...\n")
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        # Stream the decompressed body into a single buffer; going through
+        # response.text would decode the multi-MB HTML a second time and
+        # hold bytes + str copies in memory at once.
+        status_code, final_url, content_type, content = _fetch(url)
+
         print(f"✅ Response received!")
-        print(f"   Status code: {response.status_code}")
-        print(f"   Content length: {len(response.content)} bytes")
-        print(f"   Content type: {response.headers.get('content-type', 'Unknown')}\n")
+        print(f"   Status code: {status_code}")
+        print(f"   Content length: {len(content)} bytes")
+        print(f"   Content type: {content_type}\n")
 
-    except requests.exceptions.RequestException as e:
+    except _FETCH_ERRORS as e:
         print(f"❌ ERROR: Failed to fetch URL")
         print(f"   Error: {e}")
         return
 
     # Check if we got a valid response
-    if response.status_code != 200:
-        print(f"❌ ERROR: HTTP {response.status_code}")
+    if status_code != 200:
+        print(f"❌ ERROR: HTTP {status_code}")
         print("   LinkedIn may be blocking the request or the profile doesn't exist")
         return
 
-    # Parse HTML
-    print("📄 Parsing HTML...\n")
-    soup = BeautifulSoup(response.content, 'lxml')
-
     # Check if LinkedIn is showing a login wall
-    if 'authwall' in response.url or 'login' in response.url:
+    if 'authwall' in final_url or 'login' in final_url:
         print("❌ ERROR: LinkedIn redirected to login page")
         print("   This means the profile is NOT actually public")
         print("   Or LinkedIn is requiring login despite public setting")
         return
 
+    # Parse HTML
+    print("📄 Parsing HTML...\n")
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+
+        node = tree.css_first('title')
+        title_text = node.text() if node else None
+
+        node = tree.css_first('meta[property="og:title"]')
+        meta_title = node.attributes.get('content') if node else None
+
+        node = tree.css_first('meta[name="description"]')
+        meta_desc = node.attributes.get('content') if node else None
+
+        node = tree.css_first('h1')
+        h1_text = node.text(strip=True) if node else None
+
+        h2_texts = [h2.text(strip=True) for h2 in tree.css('h2')[:3]]
+        section_count = len(tree.css('section'))
+    else:
+        soup = BeautifulSoup(content, 'lxml', parse_only=_STRAINER)
+
+        node = soup.find('title')
+        title_text = node.get_text() if node else None
+
+        node = soup.find('meta', property='og:title')
+        meta_title = node.get('content') if node else None
+
+        node = soup.find('meta', {'name': 'description'})
+        meta_desc = node.get('content') if node else None
+
+        node = soup.find('h1')
+        h1_text = node.get_text(strip=True) if node else None
+
+        # XPath count() returns a number without materializing a Tag per
+        # section, and the position filter only builds the three h2
+        # elements actually shown.
+        root = lxml_html.fromstring(content)
+        h2_texts = [h2.text_content().strip() for h2 in root.xpath('//h2[position()<=3]')]
+        section_count = int(root.xpath('count(//section)'))
+
     # Look for common LinkedIn elements
     print("🔍 Searching for profile elements...\n")
 
     # Check title
-    title = soup.find('title')
-    if title:
-        print(f"   Page title: {title.get_text()[:100]}")
+    if title_text:
+        print(f"   Page title: {title_text[:100]}")
 
     # Check for meta tags
-    meta_title = soup.find('meta', property='og:title')
     if meta_title:
-        print(f"   Meta title: {meta_title.get('content', 'N/A')}")
+        print(f"   Meta title: {meta_title}")
 
-    meta_desc = soup.find('meta', {'name': 'description'})
     if meta_desc:
-        print(f"   Meta description: {meta_desc.get('content', 'N/A')[:100]}")
+        print(f"   Meta description: {meta_desc[:100]}")
 
     # Look for name
     print("\n🔍 Looking for name...")
-    name_h1 = soup.find('h1')
-    if name_h1:
-        print(f"   Found h1: {name_h1.get_text(strip=True)}")
+    if h1_text:
+        print(f"   Found h1: {h1_text}")
     else:
         print("   ❌ No h1 tag found")
 
     # Look for headline
     print("\n🔍 Looking for headline...")
-    h2_tags = soup.find_all('h2')[:3]
-    if h2_tags:
-        for i, h2 in enumerate(h2_tags):
-            print(f"   h2 #{i+1}: {h2.get_text(strip=True)[:100]}")
+    if h2_texts:
+        for i, h2 in enumerate(h2_texts):
+            print(f"   h2 #{i+1}: {h2[:100]}")
     else:
         print("   ❌ No h2 tags found")
 
     # Check for sections
     print("\n🔍 Looking for sections...")
-    sections = soup.find_all('section')
-    print(f"   Found {len(sections)} section tags")
+    print(f"   Found {section_count} section tags")
 
     # Save HTML for inspection
+    # Raw bytes, one buffered write, then an atomic rename so an aborted
+    # run never leaves a truncated dump behind.
     output_file = "debug_output.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(response.text)
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'wb', buffering=1 << 20) as f:
+        f.write(content)
+    os.replace(tmp_file, output_file)
     print(f"\n💾 Full HTML saved to: {output_file}")
     print("   You can open this file to see what LinkedIn returned")
 
     # Check for common blocking indicators
     print("\n🚨 Checking for blocking indicators...")
-    html_text = response.text.lower()
-
-    blocking_signs = {
-        'authwall': 'Authentication wall detected',
-        'login': 'Login page detected',
-        'sign in': 'Sign in prompt detected',
-        'join now': 'Join prompt detected',
-        'captcha': 'CAPTCHA detected',
-        'robot': 'Bot detection triggered'
-    }
-
-    found_blocks = []
-    for indicator, message in blocking_signs.items():
-        if indicator in html_text:
-            found_blocks.append(message)
+    hits = {match.lower() for match in _BLOCKING_PATTERN.findall(content)}
+    found_blocks = [message for indicator, message in _BLOCKING_MESSAGES.items()
+                    if indicator in hits]
 
     if found_blocks:
         print("   ❌ Potential blocking detected:")
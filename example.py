@@ -48,9 +48,17 @@ def scrape_profile_example():
 
 def batch_scrape_example():
     """
-    Example of scraping multiple profiles with rate limiting
+    Example of scraping multiple profiles concurrently with rate limiting
     """
-    import time
+    import asyncio
+
+    import aiohttp
+    from aiolimiter import AsyncLimiter
+
+    try:
+        from aioadaptive import AdaptiveClient, AdaptiveClientConfig
+    except ImportError:
+        AdaptiveClient = None
 
     scraper = LinkedInScraper()
 
@@ -61,23 +69,57 @@ def batch_scrape_example():
         "https://www.linkedin.com/in/profile3",
     ]
 
-    profiles = []
-
-    for url in profile_urls:
-        print(f"Scraping: {url}")
-
-        # Scrape the profile
-        profile_data = scraper.scrape_profile(url)
+    async def run():
+        # No more than 20 requests per minute overall - fast when
+        # LinkedIn is healthy, but still polite enough to avoid being
+        # blocked.
+        limiter = AsyncLimiter(20, 60)
+        loop = asyncio.get_running_loop()
+
+        if AdaptiveClient is not None:
+            # Vegas-style limiter: concurrency widens while latency stays
+            # flat and narrows as soon as LinkedIn starts throttling.
+            client = AdaptiveClient(AdaptiveClientConfig(algorithm="vegas"))
+            guard = client.use
+        else:
+            sem = asyncio.BoundedSemaphore(4)
+
+            def guard():
+                return sem
+
+        async def scrape(session, url):
+            print(f"Scraping: {url}")
+            async with limiter:
+                try:
+                    async with guard():
+                        async with session.get(url) as response:
+                            # Raise inside the adaptive window so 429/503
+                            # feed back into the concurrency estimate.
+                            response.raise_for_status()
+                            html = await response.read()
+                except aiohttp.ClientError as e:
+                    print(f"  ✗ Failed to fetch {url}: {e}")
+                    return None
+            # Parsing is CPU-bound; run it off the event loop so other
+            # fetches keep overlapping with it.
+            return await loop.run_in_executor(None, scraper.parse_profile, html, url)
+
+        connector = aiohttp.TCPConnector(limit=8, limit_per_host=4)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=scraper.headers
+        ) as session:
+            return await asyncio.gather(*[scrape(url=url, session=session) for url in profile_urls])
+
+    results = asyncio.run(run())
 
+    profiles = []
+    for url, profile_data in zip(profile_urls, results):
         if profile_data and profile_data.get('name'):
             profiles.append(profile_data)
             print(f"  ✓ Scraped: {profile_data['name']}")
         else:
-            print(f"  ✗ Failed to scrape")
-
-        # Rate limiting - wait 3 seconds between requests
-        # This is important to avoid being blocked
-        time.sleep(3)
+            print(f"  ✗ Failed to scrape {url}")
 
     print(f"\nSuccessfully scraped {len(profiles)} profiles")
 
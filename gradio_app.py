@@ -6,20 +6,87 @@ This provides a user-friendly web interface to scrape LinkedIn profiles
 and download the results as markdown files.
 """
 
+import asyncio
+import concurrent.futures
 import gradio as gr
-from linkedin_scraper import LinkedInScraper, generate_markdown
-import os
+from cachetools import TTLCache
+from collections import ChainMap
 import tempfile
 from datetime import datetime
 
+# Status messages are built once at import; per request we only
+# format_map the success template over a ChainMap, instead of
+# re-evaluating a triple-quoted f-string plus .strip() and a pile of
+# dict.get defaults on a warm server.
+_INVALID_URL_MESSAGE = (
+    "❌ Invalid URL format. Please provide a valid LinkedIn profile URL\n"
+    "URL should start with: https://www.linkedin.com/in/"
+)
+
+_NO_DATA_MESSAGE = """❌ Could not extract profile data. This could be due to:
+
+• LinkedIn's anti-scraping measures blocking the request
+• Private profile (not publicly visible)
+• Invalid URL
+• Network issues
+
+**Suggestions:**
+1. Ensure the profile is set to public
+2. Check the URL format
+3. Try again after a few minutes
+4. Consider using LinkedIn's official API for production use"""
+
+_SUCCESS_TEMPLATE = """✅ Successfully scraped profile!
+
+**Name:** {name}
+**Headline:** {headline}
+**Location:** {location}
+
+**Data extracted:**
+• Experience entries: {experience_count}
+• Education entries: {education_count}
+• Skills: {skills_count}
+• Languages: {languages_count}
+• Certifications: {certifications_count}
+
+**File ready for download:** {filename}"""
+
+_SUCCESS_DEFAULTS = {'name': 'Unknown', 'headline': 'N/A', 'location': 'N/A'}
+
+# Scrapes run here instead of on the event loop: fetching LinkedIn is
+# blocking I/O and parsing is CPU-bound, so concurrent users would
+# otherwise serialize behind one another. The semaphore bounds fan-in.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+_SCRAPE_SEMAPHORE = asyncio.BoundedSemaphore(8)
+
+# In-flight scrapes keyed by URL: if several users submit the same
+# profile at once (e.g. after a share link is posted), only the first
+# submission fetches; the rest await its future.
+_INFLIGHT = {}
+
+# Profiles change slowly, so successful scrapes are kept for 10 minutes.
+# Repeat submissions of a hot URL skip the network and the parse.
+PROFILE_CACHE = TTLCache(maxsize=256, ttl=600)
+
 
 class GradioLinkedInApp:
     """Gradio application for LinkedIn profile scraping"""
 
     def __init__(self):
+        # Imported lazily: linkedin_scraper drags in BeautifulSoup/lxml
+        # (several MB of RSS), which interface-only launches and --help
+        # runs never need.
+        from linkedin_scraper import (
+            LinkedInScraper,
+            canonicalize_profile_url,
+            generate_markdown,
+        )
+
         self.scraper = LinkedInScraper()
+        self._canonicalize_url = canonicalize_profile_url
+        self._generate_markdown = generate_markdown
 
-    def scrape_profile_interface(self, profile_url: str, progress=gr.Progress()):
+    async def scrape_profile_interface(self, profile_url: str, progress=gr.Progress()):
         """
         Scrape a LinkedIn profile and return results for Gradio interface
 
@@ -34,79 +101,95 @@ class GradioLinkedInApp:
         if not profile_url:
             return "❌ Please enter a LinkedIn profile URL", "", None
 
-        if not profile_url.startswith('https://www.linkedin.com/in/'):
-            return (
-                "❌ Invalid URL format. Please provide a valid LinkedIn profile URL\n"
-                "URL should start with: https://www.linkedin.com/in/",
-                "",
-                None
-            )
-
-        # Update progress
-        progress(0.2, desc="Fetching profile...")
-
-        # Scrape the profile
-        try:
-            profile_data = self.scraper.scrape_profile(profile_url)
-        except Exception as e:
-            return f"❌ Error fetching profile: {str(e)}", "", None
-
-        # Update progress
-        progress(0.6, desc="Processing data...")
-
-        # Check if we got valid data
-        if not profile_data or not profile_data.get('name'):
-            error_msg = """
-❌ Could not extract profile data. This could be due to:
-
-• LinkedIn's anti-scraping measures blocking the request
-• Private profile (not publicly visible)
-• Invalid URL
-• Network issues
-
-**Suggestions:**
-1. Ensure the profile is set to public
-2. Check the URL format
-3. Try again after a few minutes
-4. Consider using LinkedIn's official API for production use
-            """
-            return error_msg.strip(), "", None
-
-        # Generate markdown
-        progress(0.8, desc="Generating markdown...")
-        markdown_content = generate_markdown(profile_data)
+        # Canonicalizing also strips ?trk=... tracking parameters that
+        # would otherwise defeat the cache and in-flight dedupe keys.
+        profile_url = self._canonicalize_url(profile_url)
+        if profile_url is None:
+            return _INVALID_URL_MESSAGE, "", None
+
+        cache_key = profile_url
+
+        cached = PROFILE_CACHE.get(cache_key)
+        if cached is not None:
+            # Served from cache: skip the network round-trip and parse.
+            profile_data, markdown_content = cached
+        else:
+            # Update progress
+            progress(0.2, desc="Fetching profile...")
+
+            # Scrape the profile off the event loop so other users' requests
+            # keep being served while this one fetches and parses.
+            loop = asyncio.get_running_loop()
+            fut = _INFLIGHT.get(cache_key)
+            if fut is not None:
+                # Identical request already in flight: share its result
+                # instead of fetching and parsing the same page twice.
+                error, profile_data = await asyncio.shield(fut)
+            else:
+                fut = loop.create_future()
+                _INFLIGHT[cache_key] = fut
+                error = profile_data = None
+                try:
+                    async with _SCRAPE_SEMAPHORE:
+                        profile_data = await loop.run_in_executor(
+                            _EXECUTOR, self.scraper.scrape_profile, profile_url
+                        )
+                except Exception as e:
+                    error = f"❌ Error fetching profile: {str(e)}"
+                finally:
+                    _INFLIGHT.pop(cache_key, None)
+                    fut.set_result((error, profile_data))
+
+            if error:
+                return error, "", None
+
+            # Update progress
+            progress(0.6, desc="Processing data...")
+
+            # Check if we got valid data
+            if not profile_data or not profile_data.get('name'):
+                return _NO_DATA_MESSAGE, "", None
+
+            # Generate markdown
+            progress(0.8, desc="Generating markdown...")
+            markdown_content = self._generate_markdown(profile_data)
+
+            # Only successful scrapes are cached; failures stay retryable.
+            PROFILE_CACHE[cache_key] = (profile_data, markdown_content)
 
         # Create a temporary file for download
         name = profile_data.get('name', 'profile').replace(' ', '_').replace('/', '-')
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{name}_linkedin_profile_{timestamp}.md"
 
-        # Save to temp file for download
-        temp_file = os.path.join(tempfile.gettempdir(), filename)
-        with open(temp_file, 'w', encoding='utf-8') as f:
+        # Save to temp file for download: a single buffered write with no
+        # fsync, so the bytes can persist from the page cache. The unique
+        # tempfile name also avoids clobbering concurrent downloads.
+        with tempfile.NamedTemporaryFile(
+            mode='w', encoding='utf-8', buffering=1 << 20,
+            prefix=f"{name}_linkedin_profile_{timestamp}_", suffix='.md',
+            delete=False,
+        ) as f:
             f.write(markdown_content)
+            temp_file = f.name
 
         # Create success message
-        success_msg = f"""
-✅ Successfully scraped profile!
-
-**Name:** {profile_data.get('name', 'Unknown')}
-**Headline:** {profile_data.get('headline', 'N/A')}
-**Location:** {profile_data.get('location', 'N/A')}
-
-**Data extracted:**
-• Experience entries: {len(profile_data.get('experience', []))}
-• Education entries: {len(profile_data.get('education', []))}
-• Skills: {len(profile_data.get('skills', []))}
-• Languages: {len(profile_data.get('languages', []))}
-• Certifications: {len(profile_data.get('certifications', []))}
-
-**File ready for download:** {filename}
-        """
+        success_msg = _SUCCESS_TEMPLATE.format_map(ChainMap(
+            {
+                'experience_count': len(profile_data.get('experience', [])),
+                'education_count': len(profile_data.get('education', [])),
+                'skills_count': len(profile_data.get('skills', [])),
+                'languages_count': len(profile_data.get('languages', [])),
+                'certifications_count': len(profile_data.get('certifications', [])),
+                'filename': filename,
+            },
+            profile_data,
+            _SUCCESS_DEFAULTS,
+        ))
 
         progress(1.0, desc="Complete!")
 
-        return success_msg.strip(), markdown_content, temp_file
+        return success_msg, markdown_content, temp_file
 
     def create_interface(self):
         """Create and configure the Gradio interface"""